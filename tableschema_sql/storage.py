@@ -53,7 +53,9 @@ class Storage(tableschema.Storage):
         self.__connection = engine.connect()
         self.__dbschema = dbschema
         self.__prefix = prefix
+        self.__buckets = None
         self.__descriptors = {}
+        self.__schemas = {}
         self.__fallbacks = {}
         self.__autoincrement = autoincrement
         self.__only = reflect_only or (lambda _: True)
@@ -86,12 +88,14 @@ class Storage(tableschema.Storage):
 
     @property
     def buckets(self):
-        buckets = []
-        for table in self.__metadata.sorted_tables:
-            bucket = self.__mapper.restore_bucket(table.name)
-            if bucket is not None:
-                buckets.append(bucket)
-        return buckets
+        if self.__buckets is None:
+            buckets = []
+            for table in self.__metadata.sorted_tables:
+                bucket = self.__mapper.restore_bucket(table.name)
+                if bucket is not None:
+                    buckets.append(bucket)
+            self.__buckets = buckets
+        return self.__buckets
 
     def create(self, bucket, descriptor, force=False, indexes_fields=None):
         """Create bucket
@@ -127,20 +131,23 @@ class Storage(tableschema.Storage):
                 self.delete(bucket)
 
         # Define buckets
+        tables = []
         for bucket, descriptor, index_fields in zip(buckets, descriptors, indexes_fields):
             tableschema.validate(descriptor)
             table_name = self.__mapper.convert_bucket(bucket)
             autoincrement = self.__get_autoincrement_for_bucket(bucket)
             columns, constraints, indexes, fallbacks, table_comment = self.__mapper \
                 .convert_descriptor(bucket, descriptor, index_fields, autoincrement)
-            Table(table_name, self.__metadata, *(columns + constraints + indexes),
-                  comment=table_comment)
+            table = Table(table_name, self.__metadata, *(columns + constraints + indexes),
+                          comment=table_comment)
+            tables.append(table)
             self.__descriptors[bucket] = descriptor
             self.__fallbacks[bucket] = fallbacks
+        self.__buckets = None
 
         # Create tables, update metadata
         try:
-            self.__metadata.create_all()
+            self.__metadata.create_all(tables=tables)
         except sqlalchemy.exc.ProgrammingError as exception:
             if 'there is no unique constraint matching given keys' in str(exception):
                 message = 'Foreign keys can only reference primary key or unique fields\n%s'
@@ -159,10 +166,11 @@ class Storage(tableschema.Storage):
 
         # Iterate
         tables = []
+        existent = set(self.buckets)
         for bucket in buckets:
 
             # Check existent
-            if bucket not in self.buckets:
+            if bucket not in existent:
                 if not ignore:
                     message = 'Bucket "%s" doesn\'t exist.' % bucket
                     raise tableschema.exceptions.StorageError(message)
@@ -171,6 +179,7 @@ class Storage(tableschema.Storage):
             # Remove from buckets
             if bucket in self.__descriptors:
                 del self.__descriptors[bucket]
+            self.__schemas.pop(bucket, None)
 
             # Add table to tables
             table = self.__get_table(bucket)
@@ -178,14 +187,16 @@ class Storage(tableschema.Storage):
 
         # Drop tables, update metadata
         self.__metadata.drop_all(tables=tables)
-        self.__metadata.clear()
-        self.__reflect()
+        for table in tables:
+            self.__metadata.remove(table)
+        self.__buckets = None
 
     def describe(self, bucket, descriptor=None):
 
         # Set descriptor
         if descriptor is not None:
             self.__descriptors[bucket] = descriptor
+            self.__schemas.pop(bucket, None)
 
         # Get descriptor
         else:
@@ -195,29 +206,63 @@ class Storage(tableschema.Storage):
                 autoincrement = self.__get_autoincrement_for_bucket(bucket)
                 descriptor = self.__mapper.restore_descriptor(
                     table.name, table.columns, table.constraints, autoincrement)
+                self.__descriptors[bucket] = descriptor
 
         return descriptor
 
-    def iter(self, bucket):
+    def iter(self, bucket, columns=None):
+        """Iterate over rows in bucket
+
+        Rows are fetched through a streaming cursor
+        (`stream_results=True`) where the backend supports one, so memory
+        usage stays constant no matter how large the bucket is.
+
+        # Arguments
+            columns (str[]):
+                select only the named columns instead of the whole row
+
+        """
 
         # Get table and fallbacks
         table = self.__get_table(bucket)
-        schema = tableschema.Schema(self.describe(bucket))
+        schema, _ = self.__get_schema(bucket)
         autoincrement = self.__get_autoincrement_for_bucket(bucket)
 
         # Open and close transaction
         with self.__connection.begin():
             # Streaming could be not working for some backends:
             # http://docs.sqlalchemy.org/en/latest/core/connections.html
-            select = table.select().execution_options(stream_results=True)
-            result = select.execute()
-            for row in result:
-                row = self.__mapper.restore_row(
-                    row, schema=schema, autoincrement=autoincrement)
-                yield row
-
-    def read(self, bucket):
-        rows = list(self.iter(bucket))
+            if columns is None:
+                select = table.select()
+            else:
+                select = sqlalchemy.select(
+                    [table.columns[column] for column in columns])
+            select = select.execution_options(stream_results=True)
+            result = self.__connection.execute(select)
+            if columns is None:
+                restore_row = self.__mapper.restore_row
+                for row in result:
+                    row = restore_row(
+                        row, schema=schema, autoincrement=autoincrement)
+                    yield row
+            else:
+                fields = [schema.get_field(column) for column in columns]
+                for row in result:
+                    row = self.__restore_projection(row, fields)
+                    yield row
+
+    def read(self, bucket, columns=None):
+        """Read rows from bucket
+
+        Materializes the whole bucket as a list; use `storage.iter` to
+        stream rows one by one instead.
+
+        # Arguments
+            columns (str[]):
+                select only the named columns instead of the whole row
+
+        """
+        rows = list(self.iter(bucket, columns=columns))
         return rows
 
     def write(self, bucket, rows, keyed=False, as_generator=False, update_keys=None,
@@ -246,13 +291,14 @@ class Storage(tableschema.Storage):
 
         # Get table and description
         table = self.__get_table(bucket)
-        schema = tableschema.Schema(self.describe(bucket))
+        schema, field_map = self.__get_schema(bucket)
         fallbacks = self.__fallbacks.get(bucket, [])
 
         # Write rows to table
-        convert_row = partial(self.__mapper.convert_row, schema=schema, fallbacks=fallbacks)
+        convert_row = partial(self.__mapper.convert_row,
+            schema=schema, fallbacks=fallbacks, field_map=field_map)
         autoincrement = self.__get_autoincrement_for_bucket(bucket)
-        writer = Writer(table, schema,
+        writer = Writer(self.__connection, table, schema,
             # Only PostgreSQL supports "returning" so we don't use autoincrement for all
             autoincrement=autoincrement if self.__dialect in ['postgresql'] else None,
             update_keys=update_keys,
@@ -273,10 +319,31 @@ class Storage(tableschema.Storage):
             table_name = '.'.join((self.__dbschema, table_name))
         return self.__metadata.tables[table_name]
 
+    def __get_schema(self, bucket):
+        cached = self.__schemas.get(bucket)
+        if cached is None:
+            schema = tableschema.Schema(self.describe(bucket))
+            field_map = {field.name: field for field in schema.fields}
+            cached = (schema, field_map)
+            self.__schemas[bucket] = cached
+        return cached
+
+    def __restore_projection(self, row, fields):
+        values = []
+        for field, value in zip(fields, row):
+            # Non-schema columns (e.g. autoincrement) are passed through
+            if field is not None:
+                if not (self.__dialect == 'postgresql'
+                        and field.type in ['array', 'object']):
+                    value = field.cast_value(value)
+            values.append(value)
+        return values
+
     def __reflect(self):
         def only(name, _):
             return self.__only(name) and self.__mapper.restore_bucket(name) is not None
         self.__metadata.reflect(only=only)
+        self.__buckets = None
 
     def __get_autoincrement_for_bucket(self, bucket):
         if isinstance(self.__autoincrement, dict):
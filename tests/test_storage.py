@@ -190,6 +190,10 @@ def test_storage(dialect, database_url):
     storage.describe('compound', COMPOUND['schema'])
     assert storage.read('compound') == cast(COMPOUND)['data']
 
+    # Assert data with column projection
+    assert storage.read('articles', columns=['id', 'name']) == [
+        [row[0], row[2]] for row in cast(ARTICLES)['data']]
+
     # Delete non existent bucket
     with pytest.raises(tableschema.exceptions.StorageError):
         storage.delete('non_existent')
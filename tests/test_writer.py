@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import datetime
+from decimal import Decimal
+from tableschema_sql.writer import _copy_format, _CopyBuffer
+
+
+# Tests
+
+def test_copy_format_scalars():
+    assert _copy_format(None) == '\\N'
+    assert _copy_format(True) == 't'
+    assert _copy_format(False) == 'f'
+    assert _copy_format(1) == '1'
+    assert _copy_format(Decimal('9.5')) == '9.5'
+    assert _copy_format('中国人') == '中国人'
+    assert _copy_format(datetime.date(2015, 1, 1)) == '2015-01-01'
+
+
+def test_copy_format_escaping():
+    assert _copy_format('a\tb') == 'a\\tb'
+    assert _copy_format('a\nb') == 'a\\nb'
+    assert _copy_format('a\\nb') == 'a\\\\nb'
+    assert _copy_format('') == ''
+
+
+def test_copy_format_json():
+    assert _copy_format({'key': 'value'}) == '{"key": "value"}'
+    assert _copy_format([1, 2]) == '[1, 2]'
+
+
+def test_copy_buffer_chunked_reads():
+    buffer = _CopyBuffer(iter(['1\taaa\n', '2\tbbb\n']))
+    assert buffer.read(4) == '1\taa'
+    assert buffer.read(4) == 'a\n2\t'
+    assert buffer.read(100) == 'bbb\n'
+    assert buffer.read(100) == ''
+
+
+def test_copy_buffer_read_all():
+    buffer = _CopyBuffer(iter(['1\taaa\n', '2\tbbb\n']))
+    assert buffer.read() == '1\taaa\n2\tbbb\n'
+    assert buffer.read() == ''